@@ -4,6 +4,7 @@
 Inputs
 - BRAVE_API_KEY (required)
 - REDDIT_SUBREDDITS (optional, comma-separated)
+- BRAVE_MAX_QPS (optional, Brave requests per second; default 2.5)
 
 Outputs
 - docs/index.html (latest run)
@@ -12,28 +13,68 @@ Outputs
 - docs/archive.html (archive index)
 
 Notes
+- Requires Python 3.10+ (NewsItem uses dataclass slots).
 - This is heuristic news triage based on headline+snippet (no full-article parsing).
 - Keep output clean: no raw URLs/domains shown; use a single "打开链接" button.
 """
 
 from __future__ import annotations
 
+import email.utils
+import functools
 import html
+import http.client
+import io
 import json
 import os
 import re
+import sys
+import threading
 import time
 import urllib.error
 import urllib.parse
 import urllib.request
+from bisect import bisect_right
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime, timezone
-from typing import Any
+from typing import Any, Collection
 
 from zoneinfo import ZoneInfo
 
+try:
+    import orjson  # optional: faster JSON encode/decode
+except ImportError:
+    orjson = None
+
 BRAVE_ENDPOINT = "https://api.search.brave.com/res/v1/web/search"
 
+# Max in-flight HTTP requests per fan-out.
+FETCH_WORKERS = 4
+
+# Default cap on Brave request starts per second across all workers. The old
+# serial loop started one request per RTT + 0.12s sleep, i.e. about 2-3/s;
+# override with the BRAVE_MAX_QPS env var if your plan allows more.
+BRAVE_MAX_QPS = 2.5
+
+# Upper bound on how long a 429 Retry-After is honoured before the one retry.
+BRAVE_RETRY_AFTER_MAX = 30.0
+
+_JSON_HEADERS = {
+    "Accept": "application/json",
+    # Same default urlopen() sends.
+    "User-Agent": f"Python-urllib/{sys.version_info[0]}.{sys.version_info[1]}",
+}
+
+_REDIRECT_CODES = (301, 302, 303, 307, 308)
+
+# Placeholders substituted after render_html() so one render serves both pages.
+_CSS_HREF_SLOT = "__CSS_HREF__"
+_ARCHIVE_HREF_SLOT = "__ARCHIVE_HREF__"
+
+# Archive snapshot stem: YYYY-MM-DD_HHMM
+_ARCHIVE_RE = re.compile(r"^(\d{4}-\d{2}-\d{2})_(\d{2})(\d{2})$")
+
 TZ = ZoneInfo("Asia/Shanghai")
 
 CATEGORY_QUERIES: dict[str, list[str]] = {
@@ -78,16 +119,16 @@ CATEGORY_QUERIES: dict[str, list[str]] = {
 }
 
 # Email/preview-card sensitive sites (we keep the web output clean too).
-BLOCK_HOSTS = {
+BLOCK_HOSTS = frozenset({
     "youtube.com",
     "www.youtube.com",
     "youtu.be",
     "news.ycombinator.com",
     "reddit.com",
     "www.reddit.com",
-}
+})
 
-PREFERRED_HOSTS = {
+PREFERRED_HOSTS = frozenset({
     "reuters.com",
     "www.reuters.com",
     "ft.com",
@@ -128,9 +169,9 @@ PREFERRED_HOSTS = {
     "www.thepaper.cn",
     "yicai.com",
     "www.yicai.com",
-}
+})
 
-CN_HOST_BASES = {
+CN_HOST_BASES = frozenset({
     "36kr.com",
     "jiqizhixin.com",
     "qbitai.com",
@@ -141,18 +182,47 @@ CN_HOST_BASES = {
     "caixin.com",
     "thepaper.cn",
     "yicai.com",
-}
+})
 
-COMMUNITY_HOSTS = {
+COMMUNITY_HOSTS = frozenset({
     "github.com",
     "www.github.com",
     "huggingface.co",
     "www.producthunt.com",
     "producthunt.com",
-}
+})
+
+# Headline/snippet phrases that mark low-signal results.
+BLOCK_WORDS = ("sponsored", "press release", "wikipedia")
 
+ALLOW_HOSTS = PREFERRED_HOSTS | COMMUNITY_HOSTS | {"arxiv.org", "substack.com"}
 
-@dataclass
+# Headline keyword groups for score_item(); one regex scan per group.
+# re.A keeps case folding ASCII-only, matching the old title.lower() check.
+_SIGNAL_EN_RE = re.compile("launch|release|announce|introduc|beta", re.I | re.A)
+_SIGNAL_ZH_RE = re.compile("发布|上线|开源|更新|推出|正式|版本")
+_RISK_EN_RE = re.compile("security|leak|breach|ban|lawsuit|vulnerability", re.I | re.A)
+_RISK_ZH_RE = re.compile("泄露|漏洞|越狱|事故|封禁|诉讼")
+
+
+class _RateLimiter:
+    """Spaces call starts at least 1/rate seconds apart across threads."""
+
+    def __init__(self, rate: float) -> None:
+        self._interval = 1.0 / rate
+        self._lock = threading.Lock()
+        self._next = 0.0
+
+    def wait(self) -> None:
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next)
+            self._next = slot + self._interval
+        if slot > now:
+            time.sleep(slot - now)
+
+
+@dataclass(slots=True)
 class NewsItem:
     title: str
     url: str
@@ -161,19 +231,139 @@ class NewsItem:
     published: str | None
     category: str
     score: float
+    published_ts: float = 0.0
+
+
+class _Connections:
+    """Keep-alive connections owned by one fan-out, closed when it finishes.
+
+    http.client connections are not thread-safe, so each worker thread gets
+    its own connection per (scheme, host).
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._conns: dict[tuple[int, str, str], http.client.HTTPConnection] = {}
+
+    def __enter__(self) -> _Connections:
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+
+    def get(self, scheme: str, netloc: str, timeout: float) -> http.client.HTTPConnection:
+        k = (threading.get_ident(), scheme, netloc)
+        with self._lock:
+            conn = self._conns.get(k)
+            if conn is None:
+                cls = http.client.HTTPSConnection if scheme == "https" else http.client.HTTPConnection
+                conn = self._conns[k] = cls(netloc, timeout=timeout)
+        return conn
+
+    def close(self) -> None:
+        with self._lock:
+            conns = list(self._conns.values())
+            self._conns.clear()
+        for conn in conns:
+            conn.close()
 
 
-def _req_json(url: str, headers: dict[str, str] | None = None, timeout: int = 25) -> dict[str, Any]:
-    req = urllib.request.Request(url)
-    req.add_header("Accept", "application/json")
+@functools.lru_cache(maxsize=1)
+def _proxies_configured() -> bool:
+    # Proxy env vars don't change mid-run; read them once.
+    return bool(urllib.request.getproxies())
+
+
+def _get_once(url: str, headers: dict[str, str], timeout: float, conns: _Connections) -> tuple[int, str, http.client.HTTPMessage, bytes]:
+    parts = urllib.parse.urlsplit(url)
+    path = (parts.path or "/") + (f"?{parts.query}" if parts.query else "")
+    conn = conns.get(parts.scheme, parts.netloc, timeout)
+    try:
+        try:
+            conn.request("GET", path, headers=headers)
+            resp = conn.getresponse()
+        except (ConnectionResetError, BrokenPipeError):
+            # The server closed an idle keep-alive connection; reconnect once.
+            conn.close()
+            conn.request("GET", path, headers=headers)
+            resp = conn.getresponse()
+        return resp.status, resp.reason, resp.headers, resp.read()
+    except BaseException:
+        conn.close()
+        raise
+
+
+def _http_get(url: str, headers: dict[str, str], timeout: float = 25, conns: _Connections | None = None) -> bytes:
+    # GET over a connection reused from conns (saves a TCP+TLS handshake per
+    # request). Follows redirects and raises HTTPError like urlopen() does.
+    if _proxies_configured():
+        with urllib.request.urlopen(urllib.request.Request(url, headers=headers), timeout=timeout) as resp:
+            return resp.read()
+    if conns is None:
+        with _Connections() as own:
+            return _http_get(url, headers, timeout, own)
+    for _ in range(5):
+        status, reason, hdrs, body = _get_once(url, headers, timeout, conns)
+        location = hdrs.get("Location")
+        if status in _REDIRECT_CODES and location:
+            url = urllib.parse.urljoin(url, location)
+            continue
+        if status >= 400:
+            raise urllib.error.HTTPError(url, status, reason, hdrs, io.BytesIO(body))
+        return body
+    raise urllib.error.URLError(f"too many redirects: {url}")
+
+
+def _req_json(url: str, headers: dict[str, str] | None = None, timeout: int = 25, conns: _Connections | None = None) -> dict[str, Any]:
+    hdrs = dict(_JSON_HEADERS)
     for k, v in (headers or {}).items():
         if v:
-            req.add_header(k, v)
-    with urllib.request.urlopen(req, timeout=timeout) as resp:
-        raw = resp.read().decode("utf-8", errors="replace")
+            hdrs[k] = v
+    return _json_loads(_http_get(url, hdrs, timeout=timeout, conns=conns))
+
+
+def _json_loads(raw: bytes) -> Any:
+    # Both parsers take bytes directly; no separate decode pass.
+    if orjson is not None:
+        return orjson.loads(raw)
     return json.loads(raw)
 
 
+def _json_dumps_pretty(obj: Any) -> bytes:
+    # UTF-8, 2-space indent; both encoders produce the same layout.
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, ensure_ascii=False, indent=2).encode("utf-8")
+
+
+def load_brave_max_qps() -> float:
+    raw = (os.environ.get("BRAVE_MAX_QPS") or "").strip()
+    if not raw:
+        return BRAVE_MAX_QPS
+    try:
+        qps = float(raw)
+    except ValueError:
+        qps = 0.0
+    if not qps > 0:
+        raise SystemExit(f"Invalid env var BRAVE_MAX_QPS: {raw!r}")
+    return qps
+
+
+def _retry_after_seconds(value: str | None, default: float = 1.0) -> float:
+    # Retry-After is either delta-seconds or an HTTP-date.
+    if not value:
+        return default
+    try:
+        secs = float(value)
+    except ValueError:
+        try:
+            secs = email.utils.parsedate_to_datetime(value).timestamp() - time.time()
+        except (TypeError, ValueError):
+            return default
+    return min(max(0.0, secs), BRAVE_RETRY_AFTER_MAX)
+
+
+@functools.lru_cache(maxsize=1)
 def load_brave_api_key() -> str:
     k = (os.environ.get("BRAVE_API_KEY") or "").strip()
     if not k:
@@ -181,8 +371,17 @@ def load_brave_api_key() -> str:
     return k
 
 
-def brave_search(query: str, *, freshness: str = "pd", count: int = 6, country: str = "CN", search_lang: str = "zh-hans") -> list[dict[str, Any]]:
-    key = load_brave_api_key()
+def brave_search(
+    query: str,
+    *,
+    key: str | None = None,
+    freshness: str = "pd",
+    count: int = 6,
+    country: str = "CN",
+    search_lang: str = "zh-hans",
+    conns: _Connections | None = None,
+) -> list[dict[str, Any]]:
+    key = key or load_brave_api_key()
     params = {
         "q": query,
         "country": country,
@@ -192,22 +391,45 @@ def brave_search(query: str, *, freshness: str = "pd", count: int = 6, country:
         "spellcheck": "1",
     }
     url = f"{BRAVE_ENDPOINT}?{urllib.parse.urlencode(params)}"
-    req = urllib.request.Request(url)
-    req.add_header("Accept", "application/json")
-    req.add_header("X-Subscription-Token", key)
-
-    try:
-        with urllib.request.urlopen(req, timeout=25) as resp:
-            raw = resp.read().decode("utf-8", errors="replace")
-            data = json.loads(raw)
-    except urllib.error.HTTPError as e:
-        body = e.read().decode("utf-8", errors="replace") if hasattr(e, "read") else ""
-        raise RuntimeError(f"Brave HTTP {e.code}: {body[:400]}") from e
+    headers = {**_JSON_HEADERS, "X-Subscription-Token": key}
+    for attempt in (0, 1):
+        try:
+            data = _json_loads(_http_get(url, headers, timeout=25, conns=conns))
+            break
+        except urllib.error.HTTPError as e:
+            if e.code == 429 and not attempt:
+                # Rate limited: wait as asked, then retry once.
+                time.sleep(_retry_after_seconds(e.headers.get("Retry-After") if e.headers else None))
+                continue
+            body = e.read().decode("utf-8", errors="replace") if hasattr(e, "read") else ""
+            raise RuntimeError(f"Brave HTTP {e.code}: {body[:400]}") from e
 
     web = data.get("web") or {}
     return list(web.get("results") or [])
 
 
+def brave_search_many(
+    queries: list[str],
+    *,
+    key: str | None = None,
+    qps: float = BRAVE_MAX_QPS,
+    freshness: str = "pd",
+    count: int = 6,
+) -> list[list[dict[str, Any]]]:
+    # Fan out over a small thread pool; results come back in query order.
+    # Only request starts are throttled, so slow responses don't add idle time.
+    key = key or load_brave_api_key()
+    limiter = _RateLimiter(qps)
+
+    def one(q: str) -> list[dict[str, Any]]:
+        limiter.wait()
+        return brave_search(q, key=key, freshness=freshness, count=count, conns=conns)
+
+    # Workers finish before the connections are closed (exit order is reversed).
+    with _Connections() as conns, ThreadPoolExecutor(max_workers=FETCH_WORKERS) as pool:
+        return list(pool.map(one, queries))
+
+
 def hostname_from_item(item: dict[str, Any]) -> str:
     meta = item.get("meta_url")
     if isinstance(meta, dict):
@@ -221,37 +443,33 @@ def hostname_from_item(item: dict[str, Any]) -> str:
         return ""
 
 
-def is_blocked(host: str, title: str, desc: str) -> bool:
-    h = (host or "").lower()
-    if h in BLOCK_HOSTS:
-        return True
-    t = f"{title} {desc}".lower()
-    return any(x in t for x in ("sponsored", "press release", "wikipedia"))
-
-
-def _host_matches(host: str, bases: set[str]) -> bool:
-    h = (host or "").lower().strip(".")
+def _host_matches(h: str, bases: Collection[str]) -> bool:
+    # h must already be lowercased with surrounding dots stripped.
     if not h:
         return False
     if h in bases:
         return True
-    # allow common subdomains like m., cn., www.
-    return any(h.endswith("." + b) for b in bases)
-
-
-def is_allowed(host: str) -> bool:
-    h = (host or "").lower().strip(".")
-    if not h:
-        return False
-    allow_bases = set(PREFERRED_HOSTS) | set(COMMUNITY_HOSTS) | {"arxiv.org", "substack.com"}
-    return _host_matches(h, allow_bases)
+    # allow common subdomains like m., cn., www.: probe each parent domain
+    # instead of scanning every base with endswith().
+    i = h.find(".")
+    while i != -1:
+        if h[i + 1:] in bases:
+            return True
+        i = h.find(".", i + 1)
+    return False
 
 
 def parse_ts(s: str | None) -> float:
     if not s:
         return 0.0
+    return _parse_ts_cached(str(s))
+
+
+@functools.lru_cache(maxsize=1024)
+def _parse_ts_cached(s: str) -> float:
+    # Brave returns many identical timestamps per run; parse each string once.
     try:
-        dt = datetime.fromisoformat(str(s).replace("Z", "+00:00"))
+        dt = datetime.fromisoformat(s.replace("Z", "+00:00"))
         if dt.tzinfo is None:
             dt = dt.replace(tzinfo=timezone.utc)
         return dt.timestamp()
@@ -265,19 +483,27 @@ def looks_chinese(s: str) -> bool:
     return any("\u4e00" <= ch <= "\u9fff" for ch in s)
 
 
-def score_item(host: str, title: str, published: str | None, category: str, desc: str = "") -> float:
-    h = (host or "").lower().strip(".")
+def score_item(
+    host_l: str,
+    title: str,
+    category: str,
+    desc: str = "",
+    *,
+    published_ts: float,
+    now_ts: float,
+) -> float:
+    # host_l is the normalized host from _triage() (lowercased, dots stripped).
     base = 0.0
 
-    if _host_matches(h, set(PREFERRED_HOSTS)):
+    if _host_matches(host_l, PREFERRED_HOSTS):
         base += 2.2
-    elif _host_matches(h, set(COMMUNITY_HOSTS)):
+    elif _host_matches(host_l, COMMUNITY_HOSTS):
         base += 1.4
-    elif h:
+    elif host_l:
         base += 0.4
 
     # Prefer Chinese sources/content ("以中文资讯为主")
-    if _host_matches(h, CN_HOST_BASES):
+    if _host_matches(host_l, CN_HOST_BASES):
         base += 0.8
     if looks_chinese(title) or looks_chinese(desc):
         base += 0.7
@@ -285,25 +511,50 @@ def score_item(host: str, title: str, published: str | None, category: str, desc
     if category in ("产品发布/模型更新", "开源/工具爆款"):
         base += 1.0
 
-    tl = (title or "").lower()
-    tzh = title or ""
-    if any(w in tl for w in ("launch", "release", "announce", "introduc", "beta")):
+    t = title or ""
+    if _SIGNAL_EN_RE.search(t):
         base += 0.6
-    if any(w in tzh for w in ("发布", "上线", "开源", "更新", "推出", "正式", "版本")):
+    if _SIGNAL_ZH_RE.search(t):
         base += 0.45
-    if any(w in tl for w in ("security", "leak", "breach", "ban", "lawsuit", "vulnerability")):
+    if _RISK_EN_RE.search(t):
         base += 0.35
-    if any(w in tzh for w in ("泄露", "漏洞", "越狱", "事故", "封禁", "诉讼")):
+    if _RISK_ZH_RE.search(t):
         base += 0.25
 
-    ts = parse_ts(published)
-    if ts:
-        age_h = max(0.0, (time.time() - ts) / 3600.0)
+    if published_ts:
+        age_h = max(0.0, (now_ts - published_ts) / 3600.0)
         base += max(0.0, 1.2 - min(1.2, age_h / 36.0))
 
     return base
 
 
+def _triage(it: dict[str, Any], cat: str, now_ts: float) -> NewsItem | None:
+    # Block/allow/score one raw Brave result; the host is lowercased once.
+    title = str(it.get("title") or "").strip()
+    url = str(it.get("url") or "").strip()
+    if not title or not url:
+        return None
+    host = hostname_from_item(it)
+    desc = str(it.get("description") or "").strip()
+
+    host_l = host.lower()
+    if host_l in BLOCK_HOSTS:
+        return None
+    text_l = f"{title} {desc}".lower()
+    if any(x in text_l for x in BLOCK_WORDS):
+        return None
+    host_l = host_l.strip(".")
+    if not host_l or not _host_matches(host_l, ALLOW_HOSTS):
+        return None
+
+    pub = it.get("published")
+    published = str(pub) if isinstance(pub, (str, int, float)) else None
+
+    ts = parse_ts(published)
+    sc = score_item(host_l, title, cat, desc, published_ts=ts, now_ts=now_ts)
+    return NewsItem(title=title, url=url, description=desc, hostname=host or "(unknown)", published=published, category=cat, score=sc, published_ts=ts)
+
+
 def clip(s: str, n: int) -> str:
     s = (s or "").strip()
     if len(s) <= n:
@@ -311,11 +562,11 @@ def clip(s: str, n: int) -> str:
     return s[: n - 1].rstrip() + "…"
 
 
-def reddit_fetch(subreddit: str, *, kind: str = "hot", limit: int = 8) -> list[dict[str, Any]]:
+def reddit_fetch(subreddit: str, *, kind: str = "hot", limit: int = 8, conns: _Connections | None = None) -> list[dict[str, Any]]:
     # Best-effort without auth.
     url = f"https://www.reddit.com/r/{urllib.parse.quote(subreddit)}/{kind}.json?limit={limit}"
     try:
-        data = _req_json(url, headers={"User-Agent": "openclaw-ai-daily-intel/1.0"}, timeout=20)
+        data = _req_json(url, headers={"User-Agent": "openclaw-ai-daily-intel/1.0"}, timeout=20, conns=conns)
     except Exception:
         return []
 
@@ -343,6 +594,51 @@ def reddit_fetch(subreddit: str, *, kind: str = "hot", limit: int = 8) -> list[d
     return out
 
 
+# Section order on the report page.
+CATEGORY_ORDER = ("产品发布/模型更新", "开源/工具爆款", "融资/商业", "研究/论文", "监管/政策", "安全/事故")
+
+CATEGORY_COLORS = {
+    "产品发布/模型更新": "#F57C00",
+    "开源/工具爆款": "#D81B60",
+    "融资/商业": "#00897B",
+    "研究/论文": "#455A64",
+    "监管/政策": "#6D4C41",
+    "安全/事故": "#B91C1C",
+}
+HEAT_COLORS = {5: "#C2185B", 4: "#7B1FA2", 3: "#1976D2", 2: "#388E3C", 1: "#607D8B"}
+
+
+# Score thresholds for 2..5 stars (anything below the first is 1 star).
+_STAR_THRESHOLDS = (1.8, 2.9, 4.0, 5.2)
+
+
+def stars(sc: float) -> int:
+    return bisect_right(_STAR_THRESHOLDS, sc) + 1
+
+
+def _pill(text_: str, bg: str) -> str:
+    return "<span class='pill' style='background:" + bg + "'>" + html.escape(text_ or "", quote=True) + "</span>"
+
+
+def _card_head(category: str, color: str) -> str:
+    # Card prefix up to the title, as a str.format template; {heat}, {src}
+    # and {lang} are filled per item.
+    border = html.escape(color, quote=True)
+    cat = _pill(category, color).replace("{", "{{").replace("}", "}}")
+    return (
+        f"<div class='card' style='border-left:6px solid {border}'>"
+        "<div class='row'>"
+        f"<div style='display:flex;gap:8px;flex-wrap:wrap'>{{heat}}{cat}{{src}}{{lang}}</div>"
+        "</div>"
+    )
+
+
+# Colours and categories are fixed, so the per-category card prefix and the
+# five heat pills are built once at import instead of for every card.
+_CARD_HEAD_BY_CAT = {cat: _card_head(cat, c) for cat, c in CATEGORY_COLORS.items()}
+_HEAT_PILLS = {k: _pill("热度 " + "★" * k, c) for k, c in HEAT_COLORS.items()}
+
+
 def render_html(
     label: str,
     *,
@@ -355,30 +651,6 @@ def render_html(
     def esc(s: str) -> str:
         return html.escape(s or "", quote=True)
 
-    cat_color = {
-        "产品发布/模型更新": "#F57C00",
-        "开源/工具爆款": "#D81B60",
-        "融资/商业": "#00897B",
-        "研究/论文": "#455A64",
-        "监管/政策": "#6D4C41",
-        "安全/事故": "#B91C1C",
-    }
-    heat_color = {5: "#C2185B", 4: "#7B1FA2", 3: "#1976D2", 2: "#388E3C", 1: "#607D8B"}
-
-    def stars(sc: float) -> int:
-        if sc >= 5.2:
-            return 5
-        if sc >= 4.0:
-            return 4
-        if sc >= 2.9:
-            return 3
-        if sc >= 1.8:
-            return 2
-        return 1
-
-    def pill(text_: str, bg: str) -> str:
-        return "<span class='pill' style='background:" + bg + "'>" + esc(text_) + "</span>"
-
     OFFICIAL_BASES = {
         "openai.com",
         "anthropic.com",
@@ -402,164 +674,183 @@ def render_html(
     def source_tag(hostname: str, title: str, desc: str) -> str:
         h = (hostname or "").lower().strip(".")
         if _host_matches(h, OFFICIAL_BASES):
-            return pill("官宣", "#0F766E")
+            return _pill("官宣", "#0F766E")
         if _host_matches(h, MAINSTREAM_BASES):
-            return pill("主流媒体", "#1D4ED8")
+            return _pill("主流媒体", "#1D4ED8")
         if _host_matches(h, CN_HOST_BASES):
-            return pill("中文资讯", "#BE123C")
-        if _host_matches(h, set(COMMUNITY_HOSTS)):
-            return pill("开源/社区", "#7C3AED")
+            return _pill("中文资讯", "#BE123C")
+        if _host_matches(h, COMMUNITY_HOSTS):
+            return _pill("开源/社区", "#7C3AED")
         if _host_matches(h, {"arxiv.org"}):
-            return pill("论文", "#475569")
+            return _pill("论文", "#475569")
         if looks_chinese(title) or looks_chinese(desc):
-            return pill("中文资讯", "#BE123C")
-        return pill("资讯", "#374151")
+            return _pill("中文资讯", "#BE123C")
+        return _pill("资讯", "#374151")
 
     def lang_tag(title: str, desc: str) -> str:
         if looks_chinese(title) or looks_chinese(desc):
-            return pill("中文", "#166534")
-        return pill("EN", "#6B7280")
+            return _pill("中文", "#166534")
+        return _pill("EN", "#6B7280")
+
+    # An item can show up in both the Top grid and its category grid; escape,
+    # clip and tag it once and only vary the index between the two.
+    card_parts: dict[int, tuple[str, str]] = {}
 
     def card(idx: int, it: NewsItem) -> str:
-        k = stars(it.score)
-        heat = pill("热度 " + "★" * k, heat_color.get(k, "#666"))
-        catc = cat_color.get(it.category, "#666")
-        cat = pill(it.category, catc)
-        src = source_tag(it.hostname, it.title, it.description)
-        lang = lang_tag(it.title, it.description)
-        title = clip(it.title, 120)
-        desc = clip(it.description, 200)
-        btn = f"<a class='btn' href='{esc(it.url)}'>打开链接</a>"
-        parts = []
-        parts.append("<div class='card' style='border-left:6px solid " + esc(catc) + "'>")
-        parts.append("<div class='row'>")
-        parts.append("<div style='display:flex;gap:8px;flex-wrap:wrap'>" + heat + cat + src + lang + "</div>")
-        parts.append("</div>")
-        parts.append(f"<div class='title'>{idx:02d}. <a href='{esc(it.url)}'>{esc(title)}</a></div>")
-        if desc:
-            parts.append(f"<div class='desc'>{esc(desc)}</div>")
-        parts.append("<div style='margin-top:10px'>" + btn + "</div>")
-        parts.append("</div>")
-        return "".join(parts)
-
-    # Group by category
-    by_cat: dict[str, list[NewsItem]] = {}
+        parts = card_parts.get(id(it))
+        if parts is None:
+            template = _CARD_HEAD_BY_CAT.get(it.category) or _card_head(it.category, "#666")
+            head = template.format(
+                heat=_HEAT_PILLS[stars(it.score)],
+                src=source_tag(it.hostname, it.title, it.description),
+                lang=lang_tag(it.title, it.description),
+            )
+            title = clip(it.title, 120)
+            desc = clip(it.description, 200)
+            u = esc(it.url)
+            desc_html = f"<div class='desc'>{esc(desc)}</div>" if desc else ""
+            tail = (
+                f"<a href='{u}'>{esc(title)}</a></div>"
+                f"{desc_html}"
+                f"<div style='margin-top:10px'><a class='btn' href='{u}'>打开链接</a></div>"
+                "</div>"
+            )
+            parts = card_parts[id(it)] = (head, tail)
+        head, tail = parts
+        return f"{head}<div class='title'>{idx:02d}. {tail}"
+
+    # One pass over the score-sorted items: Top grid, per-category buckets
+    # capped at what gets rendered (full counts kept for the headings), and
+    # the Chinese-item chip.
+    top: list[NewsItem] = []
+    by_cat: dict[str, list[NewsItem]] = {c: [] for c in CATEGORY_ORDER}
+    cat_cnt: dict[str, int] = dict.fromkeys(CATEGORY_ORDER, 0)
+    cn_cnt = 0
     for it in items:
-        by_cat.setdefault(it.category, []).append(it)
-
-    html_lines: list[str] = []
-    html_lines.append("<!doctype html><html><head><meta charset='utf-8'>")
-    html_lines.append("<meta name='viewport' content='width=device-width, initial-scale=1' />")
-    html_lines.append("<link rel='stylesheet' href='" + esc(css_href) + "' />")
-    html_lines.append("<title>AI 日报 | " + esc(label) + "</title></head><body>")
-
-    html_lines.append("<div class='wrap'>")
-    html_lines.append("<div class='hero'>")
-    html_lines.append("<div class='h1'>AI 日报 + 情报监控</div>")
-    html_lines.append(
+        if len(top) < 10:
+            top.append(it)
+        bucket = by_cat.get(it.category)
+        if bucket is not None:
+            cat_cnt[it.category] += 1
+            if len(bucket) < 8:
+                bucket.append(it)
+        if _host_matches((it.hostname or "").lower().strip("."), CN_HOST_BASES) or looks_chinese(it.title) or looks_chinese(it.description):
+            cn_cnt += 1
+
+    buf = io.StringIO()
+
+    def w(line: str) -> None:
+        buf.write(line)
+        buf.write("\n")
+
+    w("<!doctype html><html><head><meta charset='utf-8'>")
+    w("<meta name='viewport' content='width=device-width, initial-scale=1' />")
+    w("<link rel='stylesheet' href='" + esc(css_href) + "' />")
+    w("<title>AI 日报 | " + esc(label) + "</title></head><body>")
+
+    w("<div class='wrap'>")
+    w("<div class='hero'>")
+    w("<div class='h1'>AI 日报 + 情报监控</div>")
+    w(
         "<div class='sub'>日期：" + esc(label) + "（北京时间）<br/>"
         + "来源：Brave Search（headline+snippet） + Reddit（best-effort）"
         + "</div>"
     )
 
     # Chips
-    cn_cnt = 0
-    for it in items:
-        if _host_matches((it.hostname or "").lower(), CN_HOST_BASES) or looks_chinese(it.title) or looks_chinese(it.description):
-            cn_cnt += 1
-
-    html_lines.append("<div class='chips'>")
-    html_lines.append("<span class='chip'>总条目 " + str(len(items)) + "</span>")
-    html_lines.append("<span class='chip'>中文条目 " + str(cn_cnt) + "</span>")
-    html_lines.append("<span class='chip'>Reddit 条目 " + str(len(reddit)) + "</span>")
-    html_lines.append("<span class='chip'>freshness=" + esc(str(meta.get("freshness") or "pd")) + "</span>")
-    html_lines.append("</div>")
-    html_lines.append("</div>")
+    w("<div class='chips'>")
+    w("<span class='chip'>总条目 " + str(len(items)) + "</span>")
+    w("<span class='chip'>中文条目 " + str(cn_cnt) + "</span>")
+    w("<span class='chip'>Reddit 条目 " + str(len(reddit)) + "</span>")
+    w("<span class='chip'>freshness=" + esc(str(meta.get("freshness") or "pd")) + "</span>")
+    w("</div>")
+    w("</div>")
 
     # Highlights (top 10)
-    html_lines.append("<div class='section'>")
-    html_lines.append("<div class='section-title'><span class='dot' style='background:#111827'></span>今日重点（Top）</div>")
-    html_lines.append("<div class='grid'>")
-    for i, it in enumerate(items[:10], 1):
-        html_lines.append(card(i, it))
-    html_lines.append("</div>")
-    html_lines.append("</div>")
+    w("<div class='section'>")
+    w("<div class='section-title'><span class='dot' style='background:#111827'></span>今日重点（Top）</div>")
+    w("<div class='grid'>")
+    for i, it in enumerate(top, 1):
+        w(card(i, it))
+    w("</div>")
+    w("</div>")
 
     # Categories
-    for cat in ["产品发布/模型更新", "开源/工具爆款", "融资/商业", "研究/论文", "监管/政策", "安全/事故"]:
-        lst = by_cat.get(cat) or []
+    for cat in CATEGORY_ORDER:
+        lst = by_cat[cat]
         if not lst:
             continue
-        html_lines.append("<div class='section'>")
-        c = cat_color.get(cat, "#111827")
-        html_lines.append("<div class='section-title'><span class='dot' style='background:" + esc(c) + "'></span>" + esc(cat) + "（" + str(len(lst)) + "）</div>")
-        html_lines.append("<div class='grid'>")
-        for i, it in enumerate(lst[:8], 1):
-            html_lines.append(card(i, it))
-        html_lines.append("</div>")
-        html_lines.append("</div>")
+        w("<div class='section'>")
+        c = CATEGORY_COLORS.get(cat, "#111827")
+        w("<div class='section-title'><span class='dot' style='background:" + esc(c) + "'></span>" + esc(cat) + "（" + str(cat_cnt[cat]) + "）</div>")
+        w("<div class='grid'>")
+        for i, it in enumerate(lst, 1):
+            w(card(i, it))
+        w("</div>")
+        w("</div>")
 
     # Reddit section (no raw domain)
     if reddit:
-        html_lines.append("<div class='section'>")
-        html_lines.append("<div class='section-title'><span class='dot' style='background:#111827'></span>Reddit 热门</div>")
-        html_lines.append("<div class='grid'>")
+        w("<div class='section'>")
+        w("<div class='section-title'><span class='dot' style='background:#111827'></span>Reddit 热门</div>")
+        w("<div class='grid'>")
         for i, r in enumerate(reddit[:10], 1):
             title = clip(str(r.get("title") or ""), 120)
             url = str(r.get("url") or "").strip()
             sub = str(r.get("subreddit") or "").strip()
             score = str(r.get("score") or "")
             comments = str(r.get("comments") or "")
-            parts = []
-            parts.append("<div class='card' style='border-left:6px solid #111827'>")
-            parts.append("<div class='row'>")
-            parts.append(
-                "<div style='display:flex;gap:8px;flex-wrap:wrap'>"
-                + pill("Reddit", "#111827")
-                + pill("r/" + sub, "#374151")
-                + "</div>"
+            u = esc(url)
+            w(
+                "<div class='card' style='border-left:6px solid #111827'>"
+                "<div class='row'>"
+                f"<div style='display:flex;gap:8px;flex-wrap:wrap'>{_pill('Reddit', '#111827')}{_pill('r/' + sub, '#374151')}</div>"
+                "</div>"
+                f"<div class='title'>{i:02d}. <a href='{u}'>{esc(title)}</a></div>"
+                f"<div class='meta'>score={esc(score)} · comments={esc(comments)}</div>"
+                f"<div style='margin-top:10px'><a class='btn' href='{u}'>打开链接</a></div>"
+                "</div>"
             )
-            parts.append("</div>")
-            parts.append(f"<div class='title'>{i:02d}. <a href='{esc(url)}'>{esc(title)}</a></div>")
-            parts.append(f"<div class='meta'>score={esc(score)} · comments={esc(comments)}</div>")
-            parts.append("<div style='margin-top:10px'><a class='btn' href='" + esc(url) + "'>打开链接</a></div>")
-            parts.append("</div>")
-            html_lines.append("".join(parts))
-        html_lines.append("</div>")
-        html_lines.append("</div>")
+        w("</div>")
+        w("</div>")
 
-    html_lines.append("<div class='foot'>Archive: <a href='" + esc(archive_href) + "'>历史归档</a></div>")
-    html_lines.append("</div></body></html>")
-    return "\n".join(html_lines)
+    w("<div class='foot'>Archive: <a href='" + esc(archive_href) + "'>历史归档</a></div>")
+    buf.write("</div></body></html>")
+    return buf.getvalue()
 
 
 def write_archive_index(entries: list[tuple[str, str]]) -> str:
     def esc(s: str) -> str:
         return html.escape(s or "", quote=True)
 
-    lines: list[str] = []
-    lines.append("<!doctype html><html><head><meta charset='utf-8'>")
-    lines.append("<meta name='viewport' content='width=device-width, initial-scale=1' />")
-    lines.append("<link rel='stylesheet' href='./assets/style.css' />")
-    lines.append("<title>AI 日报归档</title></head><body>")
-    lines.append("<div class='wrap'>")
-    lines.append("<div class='hero'><div class='h1'>AI 日报归档</div><div class='sub'>历史日报列表</div></div>")
-    lines.append("<div class='section'>")
-    lines.append("<div class='card'>")
-    lines.append("<ol style='margin:0;padding-left:18px'>")
+    buf = io.StringIO()
+
+    def w(line: str) -> None:
+        buf.write(line)
+        buf.write("\n")
+
+    w("<!doctype html><html><head><meta charset='utf-8'>")
+    w("<meta name='viewport' content='width=device-width, initial-scale=1' />")
+    w("<link rel='stylesheet' href='./assets/style.css' />")
+    w("<title>AI 日报归档</title></head><body>")
+    w("<div class='wrap'>")
+    w("<div class='hero'><div class='h1'>AI 日报归档</div><div class='sub'>历史日报列表</div></div>")
+    w("<div class='section'>")
+    w("<div class='card'>")
+    w("<ol style='margin:0;padding-left:18px'>")
     for rid, label in entries:
-        lines.append(
+        w(
             "<li style='margin:8px 0'><a href='./d/"
             + esc(rid)
             + ".html' style='color:#0b57d0;text-decoration:none;font-weight:900'>"
             + esc(label)
             + "</a></li>"
         )
-    lines.append("</ol>")
-    lines.append("</div>")
-    lines.append("</div>")
-    lines.append("</div></body></html>")
-    return "\n".join(lines)
+    w("</ol>")
+    w("</div>")
+    w("</div>")
+    buf.write("</div></body></html>")
+    return buf.getvalue()
 
 
 def main() -> int:
@@ -579,43 +870,30 @@ def main() -> int:
     seen: set[str] = set()
     raw: list[NewsItem] = []
     queries_run = 0
+    now_ts = time.time()
+    key = load_brave_api_key()
 
-    for cat, qs in CATEGORY_QUERIES.items():
-        for q in qs:
-            res = brave_search(q, freshness="pd", count=6)
-            queries_run += 1
-            for it in res:
-                title = str(it.get("title") or "").strip()
-                url = str(it.get("url") or "").strip()
-                if not title or not url:
-                    continue
-                if url in seen:
-                    continue
-                host = hostname_from_item(it)
-                desc = str(it.get("description") or "").strip()
-                if is_blocked(host, title, desc):
-                    continue
-                if not is_allowed(host):
-                    continue
-
-                pub = it.get("published")
-                published = str(pub) if isinstance(pub, (str, int, float)) else None
-
-                seen.add(url)
-                sc = score_item(host, title, published, cat, desc)
-                raw.append(NewsItem(title=title, url=url, description=desc, hostname=host or "(unknown)", published=published, category=cat, score=sc))
-
-            time.sleep(0.12)
-
-    raw.sort(key=lambda x: (x.score, parse_ts(x.published)), reverse=True)
+    jobs = [(cat, q) for cat, qs in CATEGORY_QUERIES.items() for q in qs]
+    results = brave_search_many([q for _cat, q in jobs], key=key, qps=load_brave_max_qps(), freshness="pd", count=6)
+
+    for (cat, _q), res in zip(jobs, results):
+        queries_run += 1
+        for it in res:
+            item = _triage(it, cat, now_ts)
+            if item is None or item.url in seen:
+                continue
+            seen.add(item.url)
+            raw.append(item)
+
+    raw.sort(key=lambda x: (x.score, x.published_ts), reverse=True)
 
     # reddit (best-effort)
     subs = (os.environ.get("REDDIT_SUBREDDITS") or "LocalLLaMA,MachineLearning,OpenAI,AI_Agents").strip()
     sub_list = [s.strip().lstrip("r/") for s in subs.split(",") if s.strip()]
     reddit: list[dict[str, Any]] = []
-    for s in sub_list[:8]:
-        reddit.extend(reddit_fetch(s, kind="hot", limit=6))
-        time.sleep(0.1)
+    with _Connections() as conns, ThreadPoolExecutor(max_workers=FETCH_WORKERS) as pool:
+        for lst in pool.map(lambda s: reddit_fetch(s, kind="hot", limit=6, conns=conns), sub_list[:8]):
+            reddit.extend(lst)
 
     meta = {
         "generatedAt": now.isoformat(),
@@ -641,37 +919,35 @@ def main() -> int:
                 "host": x.hostname,
                 "published": x.published,
                 "category": x.category,
-                "score": round(float(x.score), 3),
+                "score": round(x.score, 3),
             }
             for x in raw
         ],
         "reddit": reddit,
     }
 
+    # Serialize once; the snapshot and latest.json share the same bytes.
+    blob = _json_dumps_pretty(payload)
+
     json_path = os.path.join(data_dir, f"{run_id}.json")
-    with open(json_path, "w", encoding="utf-8") as f:
-        json.dump(payload, f, ensure_ascii=False, indent=2)
+    with open(json_path, "wb") as f:
+        f.write(blob)
 
     # Convenience handle for clients.
-    with open(os.path.join(data_dir, "latest.json"), "w", encoding="utf-8") as f:
-        json.dump(payload, f, ensure_ascii=False, indent=2)
+    with open(os.path.join(data_dir, "latest.json"), "wb") as f:
+        f.write(blob)
 
-    html_index = render_html(
+    # Render once; index.html and the d/ snapshot differ only in relative hrefs.
+    page = render_html(
         label,
         items=raw,
         reddit=reddit,
         meta=meta,
-        css_href="assets/style.css",
-        archive_href="archive.html",
-    )
-    html_day = render_html(
-        label,
-        items=raw,
-        reddit=reddit,
-        meta=meta,
-        css_href="../assets/style.css",
-        archive_href="../archive.html",
+        css_href=_CSS_HREF_SLOT,
+        archive_href=_ARCHIVE_HREF_SLOT,
     )
+    html_index = page.replace(_CSS_HREF_SLOT, "assets/style.css").replace(_ARCHIVE_HREF_SLOT, "archive.html")
+    html_day = page.replace(_CSS_HREF_SLOT, "../assets/style.css").replace(_ARCHIVE_HREF_SLOT, "../archive.html")
 
     day_path = os.path.join(d_dir, f"{run_id}.html")
     with open(day_path, "w", encoding="utf-8") as f:
@@ -684,18 +960,20 @@ def main() -> int:
 
     # archive index (all snapshots, prefer hourly stamps)
     rows: list[tuple[str, str, str]] = []
-    for name in os.listdir(d_dir):
-        if not name.endswith(".html"):
-            continue
-        stem = name[:-5]
-        m = re.match(r"^(\d{4}-\d{2}-\d{2})_(\d{2})(\d{2})$", stem)
-        if not m:
-            # ignore legacy date-only archives
-            continue
-        d, hh, mm = m.group(1), m.group(2), m.group(3)
-        sort_key = f"{d}_{hh}{mm}"
-        label2 = f"{d} {hh}:{mm}"
-        rows.append((sort_key, stem, label2))
+    with os.scandir(d_dir) as entries_it:
+        for ent in entries_it:
+            name = ent.name
+            if not name.endswith(".html") or not ent.is_file(follow_symlinks=False):
+                continue
+            stem = name[:-5]
+            m = _ARCHIVE_RE.match(stem)
+            if not m:
+                # ignore legacy date-only archives
+                continue
+            d, hh, mm = m.group(1), m.group(2), m.group(3)
+            sort_key = f"{d}_{hh}{mm}"
+            label2 = f"{d} {hh}:{mm}"
+            rows.append((sort_key, stem, label2))
 
     rows.sort(reverse=True)
     entries = [(stem, label2) for _k, stem, label2 in rows]